@@ -1081,7 +1081,7 @@ class ChatBedrock(BaseChatModel, BedrockBase):
                 if generation_info := chunk.generation_info:
                     # Check for guardrail intervention in the streaming chunk
                     services_trace = self._get_bedrock_services_signal(generation_info)
-                    if services_trace.get("signal") and run_manager:
+                    if services_trace and run_manager:
                         # Store trace info for potential callback
                         guardrails_trace_info = services_trace
 
@@ -1308,7 +1308,8 @@ class ChatBedrock(BaseChatModel, BedrockBase):
         if self._model_is_anthropic and not self.custom_get_token_ids:
             if anthropic_tokens_supported():
                 return get_token_ids_anthropic(text)
-            else:
+            elif not self._anthropic_tokens_warned:
+                self._anthropic_tokens_warned = True
                 warnings.warn(
                     "Falling back to default token method due to missing or "
                     "incompatible `anthropic` installation "
@@ -1398,7 +1399,7 @@ class ChatBedrock(BaseChatModel, BedrockBase):
                     )
 
             # true if the model is a claude 3 model
-            if "claude-" in self._get_base_model():
+            if self._is_claude:
                 if not tool_choice:
                     pass
                 elif isinstance(tool_choice, dict):
@@ -1548,7 +1549,7 @@ class ChatBedrock(BaseChatModel, BedrockBase):
             return self._as_converse.with_structured_output(
                 schema, include_raw=include_raw, strict=strict, **kwargs
             )
-        if "claude-" not in self._get_base_model():
+        if not self._is_claude:
             raise ValueError(
                 f"Structured output is not supported for model {self._get_base_model()}"
             )
@@ -1,12 +1,19 @@
 import asyncio
+import contextvars
+import functools
 import json
 import logging
+import re
+import threading
 import warnings
 from abc import ABC
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, wait
 from typing import (
     Any,
     AsyncGenerator,
     AsyncIterator,
+    Callable,
     Dict,
     Iterator,
     List,
@@ -24,7 +31,7 @@ from langchain_core.callbacks import (
 )
 from langchain_core.language_models import LLM, BaseLanguageModel, LangSmithParams
 from langchain_core.messages import AIMessageChunk, ToolCall
-from langchain_core.messages.tool import tool_call, tool_call_chunk
+from langchain_core.messages.tool import tool_call
 from langchain_core.outputs import Generation, GenerationChunk, LLMResult
 from langchain_core.utils import secret_from_env
 from pydantic import ConfigDict, Field, SecretStr, model_validator
@@ -44,6 +51,21 @@ from langchain_aws.utils import (
     thinking_on_by_default,
 )
 
+try:
+    import orjson
+
+    _json_loads: Callable[[Union[bytes, str]], Any] = orjson.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
 logger = logging.getLogger(__name__)
 
 AMAZON_BEDROCK_TRACE_KEY = "amazon-bedrock-trace"
@@ -53,41 +75,68 @@ ASSISTANT_PROMPT = "\n\nAssistant:"
 ALTERNATION_ERROR = (
     "Error: Prompt must alternate between '\n\nHuman:' and '\n\nAssistant:'."
 )
+# Longest prompt prefix echoed back in the alternation warning
+_ALTERNATION_ERROR_PROMPT_CHARS = 200
+_GENERATION_INFO_EXCLUDED_KEYS = frozenset(
+    ("prompt_token_count", "generation_token_count", "created")
+)
+# Providers that take a plain text prompt in the InvokeModel request body
+_PROMPT_PROVIDERS = frozenset(
+    ("ai21", "cohere", "meta", "mistral", "deepseek", "writer")
+)
+# Providers with an OpenAI-compatible chat completions request/response shape
+_CHAT_COMPLETIONS_PROVIDERS = frozenset(("openai", "qwen"))
+# Providers whose stream chunks carry text in a list of choices/outputs
+_CHOICES_TEXT_STREAM_PROVIDERS = frozenset(("mistral", "deepseek", "writer"))
+# Providers whose InvokeModel body is known to accept the stop-sequence key from
+# provider_stop_sequence_key_name_map on non-streaming calls
+_NATIVE_STOP_PROVIDERS = frozenset(("anthropic", "cohere"))
+_THINKING_TYPES = frozenset(("thinking", "redacted_thinking"))
+# BedrockBase fields that BedrockBase._resolve_settings derives cached state from
+_RESOLVED_SETTINGS_FIELDS = frozenset(
+    ("model_id", "base_model_id", "provider", "service_tier", "guardrails")
+)
+_HA_RE = re.compile(r"\n\n(Human|Assistant):")
+_FIRST_HA_RE = re.compile(r"(Human|Assistant):")
+# Matches the 0-2 newlines before "Human:"/"Assistant:" so they can be
+# normalized to exactly two; runs of three or more are left untouched.
+_NORMALIZE_HA_RE = re.compile(r"(?<!\n)\n{0,2}(?=Human:|Assistant:)")
 
 
 def _add_newlines_before_ha(input_text: str) -> str:
-    new_text = input_text
-    for word in ["Human:", "Assistant:"]:
-        new_text = new_text.replace(word, "\n\n" + word)
-        for i in range(2):
-            new_text = new_text.replace("\n\n\n" + word, "\n\n" + word)
-    return new_text
+    return _NORMALIZE_HA_RE.sub("\n\n", input_text)
 
 
 def _human_assistant_format(input_text: str) -> str:
-    if input_text.count("Human:") == 0 or (
-        input_text.find("Human:") > input_text.find("Assistant:")
-        and "Assistant:" in input_text
-    ):
+    first_turn = _FIRST_HA_RE.search(input_text)
+    if first_turn is None:
+        # SILENT CORRECTION
+        input_text = HUMAN_PROMPT + " " + input_text + ASSISTANT_PROMPT
+    elif first_turn.group(1) == "Assistant":
         input_text = HUMAN_PROMPT + " " + input_text  # SILENT CORRECTION
-    if input_text.count("Assistant:") == 0:
+    elif input_text.find("Assistant:", first_turn.end()) == -1:
         input_text = input_text + ASSISTANT_PROMPT  # SILENT CORRECTION
-    if input_text[: len("Human:")] == "Human:":
+    if input_text.startswith("Human:"):
         input_text = "\n\n" + input_text
     input_text = _add_newlines_before_ha(input_text)
     count = 0
+    mismatches = 0
     # track alternation
-    for i in range(len(input_text)):
-        if input_text[i : i + len(HUMAN_PROMPT)] == HUMAN_PROMPT:
-            if count % 2 == 0:
-                count += 1
-            else:
-                warnings.warn(ALTERNATION_ERROR + f" Received {input_text}")
-        if input_text[i : i + len(ASSISTANT_PROMPT)] == ASSISTANT_PROMPT:
-            if count % 2 == 1:
-                count += 1
-            else:
-                warnings.warn(ALTERNATION_ERROR + f" Received {input_text}")
+    for match in _HA_RE.finditer(input_text):
+        expected = "Human" if count % 2 == 0 else "Assistant"
+        if match.group(1) == expected:
+            count += 1
+        else:
+            mismatches += 1
+
+    if mismatches:
+        received = input_text
+        if len(received) > _ALTERNATION_ERROR_PROMPT_CHARS:
+            received = received[:_ALTERNATION_ERROR_PROMPT_CHARS] + "..."
+        warnings.warn(
+            ALTERNATION_ERROR
+            + f" Received {received} ({mismatches} out-of-order turn(s))"
+        )
 
     if count % 2 == 1:  # Only saw Human, no Assistant
         input_text = input_text + ASSISTANT_PROMPT  # SILENT CORRECTION
@@ -115,63 +164,56 @@ def _stream_response_to_generation_chunk(
             and stream_response["content_block"]["type"] == "tool_use"
         ):
             content_block = stream_response["content_block"]
-            content_block["index"] = stream_response["index"]
-            tc_chunk = tool_call_chunk(
-                index=stream_response["index"],
-                id=stream_response["content_block"]["id"],
-                name=stream_response["content_block"]["name"],
-                args="",
-            )
+            index = stream_response["index"]
+            tc_chunk = {
+                "index": index,
+                "id": content_block["id"],
+                "name": content_block["name"],
+                "args": "",
+                "type": "tool_call_chunk",
+            }
             return AIMessageChunk(
-                content=[content_block],
+                content=[{**content_block, "index": index}],
                 tool_call_chunks=[tc_chunk],  # type: ignore
             )
         elif msg_type == "content_block_delta":
-            if not stream_response["delta"]:
+            delta = stream_response["delta"]
+            if not delta:
                 return AIMessageChunk(content="")
-            if stream_response["delta"]["type"] == "text_delta":
-                if coerce_content_to_string:
-                    return AIMessageChunk(content=stream_response["delta"]["text"])
-                else:
-                    content_block = stream_response["delta"]
-                    content_block["index"] = stream_response["index"]
-                    content_block["type"] = "text"
-                    return AIMessageChunk(content=[content_block])
-            elif stream_response["delta"]["type"] == "citations_delta":
+            delta_type = delta["type"]
+            if delta_type == "text_delta" and coerce_content_to_string:
+                return AIMessageChunk(content=delta["text"])
+            index = stream_response.get("index")
+            if delta_type == "text_delta":
+                return AIMessageChunk(
+                    content=[{**delta, "index": index, "type": "text"}]
+                )
+            elif delta_type == "citations_delta":
                 return AIMessageChunk(
                     content=[
                         {
                             "type": "text",
                             "text": "",
-                            "citations": [stream_response["delta"]["citation"]],
-                            "index": stream_response["index"],
+                            "citations": [delta["citation"]],
+                            "index": index,
                         }
                     ]
                 )
-            elif stream_response["delta"]["type"] == "input_json_delta":
-                content_block = stream_response["delta"]
-                content_block["index"] = stream_response["index"]
-                content_block["type"] = "tool_use"
+            elif delta_type == "input_json_delta":
                 tc_chunk = {
-                    "index": stream_response["index"],
+                    "index": index,
                     "id": None,
                     "name": None,
-                    "args": stream_response["delta"]["partial_json"],
+                    "args": delta["partial_json"],
                 }
                 return AIMessageChunk(
-                    content=[content_block],
+                    content=[{**delta, "index": index, "type": "tool_use"}],
                     tool_call_chunks=[tc_chunk],  # type: ignore
                 )
-            elif stream_response["delta"]["type"] == "thinking_delta":
-                content_block = stream_response["delta"]
-                content_block["index"] = stream_response["index"]
-                content_block["type"] = "thinking"
-                return AIMessageChunk(content=[content_block])
-            elif stream_response["delta"]["type"] == "signature_delta":
-                content_block = stream_response["delta"]
-                content_block["index"] = stream_response["index"]
-                content_block["type"] = "thinking"
-                return AIMessageChunk(content=[content_block])
+            elif delta_type in ("thinking_delta", "signature_delta"):
+                return AIMessageChunk(
+                    content=[{**delta, "index": index, "type": "thinking"}]
+                )
         elif msg_type == "message_delta":
             return AIMessageChunk(
                 content="",
@@ -184,16 +226,14 @@ def _stream_response_to_generation_chunk(
             return None
 
     # chunk obj format varies with provider
-    generation_info = {
-        k: v
-        for k, v in stream_response.items()
-        if k
-        not in [output_key, "prompt_token_count", "generation_token_count", "created"]
-    }
+    generation_info = dict(stream_response)
+    generation_info.pop(output_key, None)
+    for key in _GENERATION_INFO_EXCLUDED_KEYS:
+        generation_info.pop(key, None)
 
-    if provider in ["mistral", "deepseek", "writer"]:
+    if provider in _CHOICES_TEXT_STREAM_PROVIDERS:
         text = stream_response[output_key][0]["text"]
-    elif provider in ["openai", "qwen"]:
+    elif provider in _CHAT_COMPLETIONS_PROVIDERS:
         text = stream_response[output_key][0]["delta"].get("content", "")
     else:
         text = stream_response[output_key]
@@ -204,6 +244,15 @@ def _stream_response_to_generation_chunk(
     )
 
 
+def _sum_token_counts(token_counts: Union[int, List[int]]) -> int:
+    """Sum token counts reported either as a single int or a list of ints."""
+    if isinstance(token_counts, int):
+        return token_counts
+    if len(token_counts) == 1:
+        return token_counts[0]
+    return sum(token_counts)
+
+
 def _combine_generation_info_for_llm_result(
     chunks_generation_info: List[Dict[str, Any]], provider_stop_code: str
 ) -> Dict[str, Any]:
@@ -214,43 +263,51 @@ def _combine_generation_info_for_llm_result(
     the generation_info from some of these chunks should contain "usage" keys
     if not, the token counts should be found within "amazon-bedrock-invocationMetrics"
     """
-    total_usage_info = {"prompt_tokens": 0, "completion_tokens": 0}
+    prompt_tokens = 0
+    completion_tokens = 0
     stop_reason = ""
     for generation_info in chunks_generation_info:
         if "usage" in generation_info:
             usage_info = generation_info["usage"]
             if "input_tokens" in usage_info:
-                total_usage_info["prompt_tokens"] += sum(usage_info["input_tokens"])
+                prompt_tokens += _sum_token_counts(usage_info["input_tokens"])
             if "output_tokens" in usage_info:
-                total_usage_info["completion_tokens"] += sum(
-                    usage_info["output_tokens"]
-                )
+                completion_tokens += _sum_token_counts(usage_info["output_tokens"])
         if "amazon-bedrock-invocationMetrics" in generation_info:
             usage_info = generation_info["amazon-bedrock-invocationMetrics"]
             if "inputTokenCount" in usage_info:
-                total_usage_info["prompt_tokens"] += usage_info["inputTokenCount"]
+                prompt_tokens += usage_info["inputTokenCount"]
             if "outputTokenCount" in usage_info:
-                total_usage_info["completion_tokens"] += usage_info["outputTokenCount"]
+                completion_tokens += usage_info["outputTokenCount"]
 
         if provider_stop_code is not None and provider_stop_code in generation_info:
             # uses the last stop reason
             stop_reason = generation_info[provider_stop_code]
 
-    total_usage_info["total_tokens"] = (
-        total_usage_info["prompt_tokens"] + total_usage_info["completion_tokens"]
-    )
+    total_usage_info = {
+        "prompt_tokens": prompt_tokens,
+        "completion_tokens": completion_tokens,
+        "total_tokens": prompt_tokens + completion_tokens,
+    }
 
     return {"usage": total_usage_info, "stop_reason": stop_reason}
 
 
+# Returned when the final stream chunk carries no invocation metrics. Callers
+# only read generation_info, so a single shared instance is enough.
+_EMPTY_METRICS_CHUNK = GenerationChunk(text="", generation_info={})
+
+
 def _get_invocation_metrics_chunk(chunk: Dict[str, Any]) -> GenerationChunk:
-    generation_info = {}
-    if metrics := chunk.get("amazon-bedrock-invocationMetrics"):
-        input_tokens = metrics.get("inputTokenCount", 0)
-        output_tokens = metrics.get("outputTokenCount", 0)
-        cache_read_input_tokens = metrics.get("cacheReadInputTokenCount", 0)
-        cache_write_input_tokens = metrics.get("cacheWriteInputTokenCount", 0)
-        generation_info["usage_metadata"] = {
+    metrics = chunk.get("amazon-bedrock-invocationMetrics")
+    if not metrics:
+        return _EMPTY_METRICS_CHUNK
+    input_tokens = metrics.get("inputTokenCount", 0)
+    output_tokens = metrics.get("outputTokenCount", 0)
+    cache_read_input_tokens = metrics.get("cacheReadInputTokenCount", 0)
+    cache_write_input_tokens = metrics.get("cacheWriteInputTokenCount", 0)
+    generation_info = {
+        "usage_metadata": {
             "input_tokens": input_tokens,
             "output_tokens": output_tokens,
             "total_tokens": input_tokens + output_tokens,
@@ -259,18 +316,70 @@ def _get_invocation_metrics_chunk(chunk: Dict[str, Any]) -> GenerationChunk:
                 "cache_read": cache_read_input_tokens,
             },
         }
+    }
     return GenerationChunk(text="", generation_info=generation_info)
 
 
+def _is_writer_done(chunk_obj: Any, output_key: str) -> bool:
+    return chunk_obj == "[DONE]"
+
+
+def _is_cohere_done(chunk_obj: Any, output_key: str) -> bool:
+    return chunk_obj["is_finished"] or chunk_obj[output_key] == "<EOS_TOKEN>"
+
+
+def _is_deepseek_stop(chunk_obj: Any, output_key: str) -> bool:
+    opt = chunk_obj.get(output_key, [{}])[0]
+    return (
+        opt.get("stop_reason") in ["stop", "length"]
+        or opt.get("finish_reason") == "eos_token"
+    )
+
+
+def _is_mistral_stop(chunk_obj: Any, output_key: str) -> bool:
+    return chunk_obj.get(output_key, [{}])[0].get("stop_reason", "") == "stop"
+
+
+def _is_meta_stop(chunk_obj: Any, output_key: str) -> bool:
+    return chunk_obj.get("stop_reason", "") == "stop"
+
+
+def _is_openai_stop(chunk_obj: Any, output_key: str) -> bool:
+    return chunk_obj.get(output_key, [{}])[0].get("finish_reason", "") == "stop"
+
+
+def _is_message_stop(chunk_obj: Any, output_key: str) -> bool:
+    return chunk_obj.get("type") == "message_stop"
+
+
+# Stream chunks that only mark the end of the stream and carry no content.
+_STREAM_SENTINEL_CHECKS: Dict[str, Callable[[Any, str], bool]] = {
+    "writer": _is_writer_done,
+    "cohere": _is_cohere_done,
+}
+
+# Stream chunks that carry the last piece of content along with the
+# invocation metrics.
+_STREAM_FINAL_CHECKS: Dict[str, Callable[[Any, str], bool]] = {
+    "deepseek": _is_deepseek_stop,
+    "mistral": _is_mistral_stop,
+    "meta": _is_meta_stop,
+    "openai": _is_openai_stop,
+    "qwen": _is_openai_stop,
+}
+
+
+def _tool_use_blocks_to_tool_calls(tool_use_blocks: List[dict]) -> List[ToolCall]:
+    return [
+        tool_call(name=block["name"], args=block["input"], id=block["id"])
+        for block in tool_use_blocks
+    ]
+
+
 def extract_tool_calls(content: List[dict]) -> List[ToolCall]:
-    tool_calls = []
-    for block in content:
-        if block["type"] != "tool_use":
-            continue
-        tool_calls.append(
-            tool_call(name=block["name"], args=block["input"], id=block["id"])
-        )
-    return tool_calls
+    return _tool_use_blocks_to_tool_calls(
+        [block for block in content if block["type"] == "tool_use"]
+    )
 
 
 def _citations_enabled(messages: list[dict[str, Any]]) -> bool:
@@ -286,6 +395,98 @@ def _citations_enabled(messages: list[dict[str, Any]]) -> bool:
     return False
 
 
+# Request body key for the max tokens setting of prompt-based providers
+_MAX_TOKENS_KEYS = {
+    "cohere": "max_tokens",
+    "meta": "max_gen_len",
+    "mistral": "max_tokens",
+    "deepseek": "max_tokens",
+    "writer": "max_tokens",
+}
+
+
+# Text extractors for non-Anthropic InvokeModel response bodies
+_TEXT_EXTRACTORS: Dict[str, Callable[[Any], Any]] = {
+    "deepseek": lambda body: body.get("choices")[0].get("text"),
+    "writer": lambda body: body.get("choices")[0].get("text"),
+    "ai21": lambda body: body.get("completions")[0].get("data").get("text"),
+    "cohere": lambda body: body.get("generations")[0].get("text"),
+    "meta": lambda body: body.get("generation"),
+    "mistral": lambda body: body.get("outputs")[0].get("text"),
+    "openai": lambda body: body.get("choices")[0].get("message").get("content"),
+    "qwen": lambda body: body.get("choices")[0].get("message").get("content"),
+}
+
+
+def _extract_default_text(body: Any) -> Any:
+    return body.get("results")[0].get("outputText")
+
+
+_EXECUTORS: Dict[int, ThreadPoolExecutor] = {}
+_EXECUTORS_LOCK = threading.Lock()
+
+
+def _get_executor(max_workers: int) -> ThreadPoolExecutor:
+    """Return the shared thread pool used for blocking Bedrock calls.
+
+    Pools are keyed by size so that instances never spawn their own threads.
+    """
+    with _EXECUTORS_LOCK:
+        executor = _EXECUTORS.get(max_workers)
+        if executor is None:
+            executor = ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="langchain-aws-bedrock"
+            )
+            _EXECUTORS[max_workers] = executor
+        return executor
+
+
+# Least recently used clients are dropped once the cache is full
+_MAX_SHARED_CLIENTS = 32
+_CLIENTS: OrderedDict[Tuple[Any, ...], Any] = OrderedDict()
+_CLIENTS_LOCK = threading.Lock()
+
+
+def _config_signature(config: Any) -> Any:
+    """Return a hashable signature of a botocore ``Config``."""
+    if config is None:
+        return None
+    options = getattr(config, "_user_provided_options", None)
+    if options is None:
+        return id(config)
+    return repr(sorted(options.items()))
+
+
+def _get_shared_client(**kwargs: Any) -> Any:
+    """Return a boto3 client shared by instances with the same settings.
+
+    boto3 clients are thread safe, so instances built with identical
+    credentials, endpoint and config can reuse one connection pool. Clients
+    using a session token or API key are never shared: those credentials
+    rotate, and caching them would keep stale clients and secrets alive.
+    """
+    if any(
+        secret is not None and secret.get_secret_value()
+        for secret in (kwargs.get("aws_session_token"), kwargs.get("api_key"))
+    ):
+        return create_aws_client(**kwargs)
+
+    key = tuple(
+        _config_signature(value) if name == "config" else value
+        for name, value in sorted(kwargs.items())
+    )
+    with _CLIENTS_LOCK:
+        client = _CLIENTS.get(key)
+        if client is None:
+            client = create_aws_client(**kwargs)
+            _CLIENTS[key] = client
+            if len(_CLIENTS) > _MAX_SHARED_CLIENTS:
+                _CLIENTS.popitem(last=False)
+        else:
+            _CLIENTS.move_to_end(key)
+        return client
+
+
 class AnthropicTool(TypedDict):
     name: str
     description: str
@@ -357,30 +558,26 @@ class LLMInputOutputAdapter:
                             # Make sure the assistant message has thinking first
                             asst_content = messages[-2].get("content", [])
                             if isinstance(asst_content, list) and asst_content:
-                                # Find thinking blocks and move them to the front if
-                                # needed
-                                thinking_blocks = [
-                                    block
-                                    for block in asst_content
-                                    if isinstance(block, dict)
-                                    and block.get("type")
-                                    in ["thinking", "redacted_thinking"]
-                                ]
-                                if thinking_blocks and asst_content[0].get(
-                                    "type"
-                                ) not in ["thinking", "redacted_thinking"]:
+                                # Split thinking blocks from the rest in one pass
+                                # and move them to the front if needed
+                                thinking_blocks = []
+                                other_blocks = []
+                                for block in asst_content:
+                                    if (
+                                        isinstance(block, dict)
+                                        and block.get("type") in _THINKING_TYPES
+                                    ):
+                                        thinking_blocks.append(block)
+                                    else:
+                                        other_blocks.append(block)
+                                if (
+                                    thinking_blocks
+                                    and asst_content[0] is not thinking_blocks[0]
+                                ):
                                     # Reorder to put thinking blocks first
-                                    new_content = thinking_blocks.copy()
-                                    new_content.extend(
-                                        [
-                                            block
-                                            for block in asst_content
-                                            if isinstance(block, dict)
-                                            and block.get("type")
-                                            not in ["thinking", "redacted_thinking"]
-                                        ]
+                                    messages[-2]["content"] = (
+                                        thinking_blocks + other_blocks
                                     )
-                                    messages[-2]["content"] = new_content
 
                 input_body["messages"] = messages
                 if system:
@@ -400,26 +597,15 @@ class LLMInputOutputAdapter:
             if temperature is not None:
                 input_body["temperature"] = temperature
 
-        elif provider in ("ai21", "cohere", "meta", "mistral", "deepseek", "writer"):
+        elif provider in _PROMPT_PROVIDERS:
             input_body["prompt"] = prompt
-            if max_tokens:
-                if provider == "cohere":
-                    input_body["max_tokens"] = max_tokens
-                elif provider == "meta":
-                    input_body["max_gen_len"] = max_tokens
-                elif provider == "mistral":
-                    input_body["max_tokens"] = max_tokens
-                elif provider == "deepseek":
-                    input_body["max_tokens"] = max_tokens
-                elif provider == "writer":
-                    input_body["max_tokens"] = max_tokens
-                else:
-                    # TODO: Add AI21 support, param depends on specific model.
-                    pass
+            # TODO: Add AI21 support, param depends on specific model.
+            if max_tokens and (max_tokens_key := _MAX_TOKENS_KEYS.get(provider)):
+                input_body[max_tokens_key] = max_tokens
             if temperature is not None:
                 input_body["temperature"] = temperature
 
-        elif provider in ("openai", "qwen"):
+        elif provider in _CHAT_COMPLETIONS_PROVIDERS:
             input_body["messages"] = messages
             if max_tokens:
                 input_body["max_tokens"] = max_tokens
@@ -445,62 +631,52 @@ class LLMInputOutputAdapter:
         text = ""
         tool_calls = []
         thinking = {}
-        response_body = json.loads(response.get("body").read().decode())
+        response_body = _json_loads(response.get("body").read())
 
         if provider == "anthropic":
             if "completion" in response_body:
                 text = response_body.get("completion")
             elif "content" in response_body:
                 content = response_body.get("content", [])
-                # Extract text content
-                text_blocks = [
-                    block["text"] for block in content if block.get("type") == "text"
-                ]
-                if text_blocks:
-                    text = "".join(text_blocks)
-
-                # Extract thinking content
-                thinking_blocks = [
-                    block for block in content if block.get("type") == "thinking"
-                ]
-                if thinking_blocks:
-                    # Get the first thinking block (there's typically just one)
-                    thinking_block = thinking_blocks[0]
-                    thinking = {
+                # Classify text, thinking and tool use blocks in a single pass
+                text_blocks = []
+                thinking_block = None
+                tool_use_blocks = []
+                for block in content:
+                    block_type = block.get("type")
+                    if block_type == "text":
+                        text_blocks.append(block["text"])
+                    elif block_type == "thinking":
+                        # Keep the first thinking block (there's typically just one)
+                        if thinking_block is None:
+                            thinking_block = block
+                    elif block_type == "tool_use":
+                        tool_use_blocks.append(block)
+
+                text = "".join(text_blocks)
+                thinking = (
+                    {
                         "text": thinking_block.get("thinking", ""),
                         "signature": thinking_block.get("signature", ""),
                     }
+                    if thinking_block is not None
+                    else {}
+                )
 
-                # Extract tool calls if present
-                if any(block.get("type") == "tool_use" for block in content):
-                    tool_calls = extract_tool_calls(content)
+                tool_calls = _tool_use_blocks_to_tool_calls(tool_use_blocks)
 
         else:
-            if provider in ["deepseek", "writer"]:
-                text = response_body.get("choices")[0].get("text")
-            elif provider == "ai21":
-                text = response_body.get("completions")[0].get("data").get("text")
-            elif provider == "cohere":
-                text = response_body.get("generations")[0].get("text")
-            elif provider == "meta":
-                text = response_body.get("generation")
-            elif provider == "mistral":
-                text = response_body.get("outputs")[0].get("text")
-            elif provider == "openai":
-                text = response_body.get("choices")[0].get("message").get("content")
-            elif provider == "qwen":
-                text = response_body.get("choices")[0].get("message").get("content")
-            else:
-                text = response_body.get("results")[0].get("outputText")
-
-        headers = response.get("ResponseMetadata", {}).get("HTTPHeaders", {})
-        prompt_tokens = int(headers.get("x-amzn-bedrock-input-token-count", 0))
-        completion_tokens = int(headers.get("x-amzn-bedrock-output-token-count", 0))
+            extract_text = _TEXT_EXTRACTORS.get(provider, _extract_default_text)
+            text = extract_text(response_body)
+
+        get_header = response.get("ResponseMetadata", {}).get("HTTPHeaders", {}).get
+        prompt_tokens = int(get_header("x-amzn-bedrock-input-token-count") or 0)
+        completion_tokens = int(get_header("x-amzn-bedrock-output-token-count") or 0)
         cache_read_input_tokens = int(
-            headers.get("x-amzn-bedrock-cache-read-input-token-count", 0)
+            get_header("x-amzn-bedrock-cache-read-input-token-count") or 0
         )
         cache_write_input_tokens = int(
-            headers.get("x-amzn-bedrock-cache-write-input-token-count", 0)
+            get_header("x-amzn-bedrock-cache-write-input-token-count") or 0
         )
         return {
             "text": text,
@@ -543,19 +719,19 @@ class LLMInputOutputAdapter:
                 f"Unknown streaming response output key for provider: {provider}"
             )
 
+        is_sentinel = _STREAM_SENTINEL_CHECKS.get(provider)
+        is_final = _STREAM_FINAL_CHECKS.get(provider)
+        if is_final is None and messages_api:
+            is_final = _is_message_stop
+
         for event in stream:
             chunk = event.get("chunk")
             if not chunk:
                 continue
 
-            chunk_obj = json.loads(chunk.get("bytes").decode())
-
-            if provider == "writer" and chunk_obj == "[DONE]":
-                return
+            chunk_obj = _json_loads(chunk["bytes"])
 
-            elif provider == "cohere" and (
-                chunk_obj["is_finished"] or chunk_obj[output_key] == "<EOS_TOKEN>"
-            ):
+            if is_sentinel is not None and is_sentinel(chunk_obj, output_key):
                 return
 
             generation_chunk = _stream_response_to_generation_chunk(
@@ -568,35 +744,7 @@ class LLMInputOutputAdapter:
             if generation_chunk:
                 yield generation_chunk
 
-            if provider == "deepseek":
-                opt = chunk_obj.get(output_key, [{}])[0]
-                if (
-                    opt.get("stop_reason") in ["stop", "length"]
-                    or opt.get("finish_reason") == "eos_token"
-                ):
-                    yield _get_invocation_metrics_chunk(chunk_obj)
-                    return
-
-            elif (
-                provider == "mistral"
-                and chunk_obj.get(output_key, [{}])[0].get("stop_reason", "") == "stop"
-            ):
-                yield _get_invocation_metrics_chunk(chunk_obj)
-                return
-
-            elif provider == "meta" and chunk_obj.get("stop_reason", "") == "stop":
-                yield _get_invocation_metrics_chunk(chunk_obj)
-                return
-
-            elif (
-                provider in ("qwen", "openai")
-                and chunk_obj.get(output_key, [{}])[0].get("finish_reason", "")
-                == "stop"
-            ):
-                yield _get_invocation_metrics_chunk(chunk_obj)
-                return
-
-            elif messages_api and (chunk_obj.get("type") == "message_stop"):
+            if is_final is not None and is_final(chunk_obj, output_key):
                 yield _get_invocation_metrics_chunk(chunk_obj)
                 return
 
@@ -621,30 +769,17 @@ class LLMInputOutputAdapter:
                 f"Unknown streaming response output key for provider: {provider}"
             )
 
+        is_sentinel = _STREAM_SENTINEL_CHECKS.get(provider)
+        is_final = _STREAM_FINAL_CHECKS.get(provider)
+
         for event in stream:
             chunk = event.get("chunk")
             if not chunk:
                 continue
 
-            chunk_obj = json.loads(chunk.get("bytes").decode())
+            chunk_obj = _json_loads(chunk["bytes"])
 
-            if provider == "cohere" and (
-                chunk_obj["is_finished"] or chunk_obj[output_key] == "<EOS_TOKEN>"
-            ):
-                return
-
-            if (
-                provider == "mistral"
-                and chunk_obj.get(output_key, [{}])[0].get("stop_reason", "") == "stop"
-            ):
-                return
-
-            elif (
-                provider in ("qwen", "openai")
-                and chunk_obj.get(output_key, [{}])[0].get("finish_reason", "")
-                == "stop"
-            ):
-                yield _get_invocation_metrics_chunk(chunk_obj)
+            if is_sentinel is not None and is_sentinel(chunk_obj, output_key):
                 return
 
             generation_chunk = _stream_response_to_generation_chunk(
@@ -656,8 +791,10 @@ class LLMInputOutputAdapter:
             )
             if generation_chunk:
                 yield generation_chunk
-            else:
-                continue
+
+            if is_final is not None and is_final(chunk_obj, output_key):
+                yield _get_invocation_metrics_chunk(chunk_obj)
+                return
 
 
 class BedrockBase(BaseLanguageModel, ABC):
@@ -896,6 +1033,35 @@ class BedrockBase(BaseLanguageModel, ABC):
     If not provided, AWS uses the default tier.
     """
 
+    max_parallel_requests: int = Field(default=10, gt=0)
+    """Maximum number of Bedrock requests run concurrently.
+
+    Blocking boto3 calls made by async methods, and the per-prompt calls of a
+    sync `batch`/`generate` over several prompts, run on a thread pool of this
+    size instead of the event loop's default executor. The pool is shared by
+    every instance in the process with the same `max_parallel_requests`, so a
+    large sync batch can delay concurrent `astream` calls queued behind it.
+    Async `abatch`/`agenerate` also keep at most this many responses streaming.
+    """
+
+    client_shared: bool = False
+    """Reuse boto3 clients across instances created with the same settings.
+
+    When enabled, instances with identical region, credentials, endpoint and
+    config share one client, and therefore one connection pool, instead of
+    each creating their own. Instances authenticated with a session token or
+    API key always get their own client.
+    """
+
+    _cached_provider: Optional[str] = None
+    _cached_base_model: Optional[str] = None
+    _is_claude: bool = False
+    _guardrails_enabled: bool = False
+    _guardrails_trace_enabled: bool = False
+    _request_options: Dict[str, Any] = {}
+    _identifying_guardrails: Dict[str, Any] = {}
+    _anthropic_tokens_warned: bool = False
+
     @property
     def lc_secrets(self) -> Dict[str, str]:
         return {
@@ -906,25 +1072,35 @@ class BedrockBase(BaseLanguageModel, ABC):
         }
 
     def _get_effective_config(self) -> Any:
-        """Merge timeout/max_retries into botocore Config if set."""
-        if self.timeout is None and self.max_retries is None:
+        """Merge timeout/max_retries/pool size into botocore Config if set."""
+        # botocore keeps 10 connections per client by default, more concurrent
+        # requests than that would block waiting for a free connection
+        pool_size = getattr(self.config, "max_pool_connections", None)
+        if not isinstance(pool_size, int):
+            pool_size = 10
+        grow_pool = self.max_parallel_requests > pool_size
+        if self.timeout is None and self.max_retries is None and not grow_pool:
             return self.config
 
         from botocore.config import Config
 
-        override = Config(
-            connect_timeout=self.timeout,
-            read_timeout=self.timeout,
-            retries=(
-                {"max_attempts": self.max_retries}
-                if self.max_retries is not None
-                else None
-            ),
-        )
+        config = self.config
+        if self.timeout is not None or self.max_retries is not None:
+            override = Config(
+                connect_timeout=self.timeout,
+                read_timeout=self.timeout,
+                retries=(
+                    {"max_attempts": self.max_retries}
+                    if self.max_retries is not None
+                    else None
+                ),
+            )
+            config = config.merge(override) if config is not None else override
 
-        if self.config is not None:
-            return self.config.merge(override)
-        return override
+        if grow_pool:
+            pool = Config(max_pool_connections=self.max_parallel_requests)
+            config = config.merge(pool) if config is not None else pool
+        return config
 
     @model_validator(mode="after")
     def validate_environment(self) -> Self:
@@ -942,10 +1118,11 @@ class BedrockBase(BaseLanguageModel, ABC):
                 self.model_kwargs.pop("max_tokens")
 
         effective_config = self._get_effective_config()
+        client_factory = _get_shared_client if self.client_shared else create_aws_client
 
         # Skip creating new client if passed in constructor
         if self.client is None:
-            self.client = create_aws_client(
+            self.client = client_factory(
                 region_name=self.region_name,
                 credentials_profile_name=self.credentials_profile_name,
                 aws_access_key_id=self.aws_access_key_id,
@@ -973,7 +1150,7 @@ class BedrockBase(BaseLanguageModel, ABC):
                     pass
 
             # Prioritize directly passed parameters over those extracted from client
-            self.bedrock_client = create_aws_client(
+            self.bedrock_client = client_factory(
                 region_name=self.region_name or bedrock_client_cfg.get("region_name"),
                 credentials_profile_name=self.credentials_profile_name,
                 aws_access_key_id=self.aws_access_key_id,
@@ -997,9 +1174,64 @@ class BedrockBase(BaseLanguageModel, ABC):
                 # Format: arn:aws:bedrock:region::foundation-model/provider.model-name
                 self.base_model_id = model_arn.split("/")[-1]
 
+        self._resolve_settings()
+
         _add_langchain_aws_version(self)
         return self
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+        # Settings resolved from these fields must follow reassignment, the
+        # model does not re-run validation on assignment
+        if (
+            name in _RESOLVED_SETTINGS_FIELDS
+            and getattr(self, "__pydantic_private__", None) is not None
+        ):
+            self._resolve_settings()
+
+    def _resolve_settings(self) -> None:
+        """Resolve the per-call settings derived from the model configuration.
+
+        The provider, base model, guardrail flags and InvokeModel request options
+        are used on every call, so they are computed here instead.
+        """
+        self._cached_provider = None
+        self._cached_base_model = None
+        try:
+            self._cached_provider = self._get_provider()
+        except ValueError:
+            # Model ARN without a provider, _get_provider raises on use instead
+            pass
+        self._cached_base_model = self._get_base_model()
+        self._is_claude = "claude-" in self._cached_base_model
+
+        request_options: Dict[str, Any] = {
+            "modelId": self.model_id,
+            "accept": "application/json",
+            "contentType": "application/json",
+        }
+        if self.service_tier:
+            request_options["serviceTier"] = self.service_tier
+
+        guardrails = self.guardrails or {}
+        self._identifying_guardrails = {
+            "trace": guardrails.get("trace"),
+            "guardrailIdentifier": guardrails.get("guardrailIdentifier"),
+            "guardrailVersion": guardrails.get("guardrailVersion"),
+        }
+        self._guardrails_enabled = self._check_guardrails_enabled()
+        self._guardrails_trace_enabled = self._guardrails_enabled and bool(
+            guardrails.get("trace")
+        )
+        if self._guardrails_enabled:
+            request_options["guardrailIdentifier"] = guardrails.get(
+                "guardrailIdentifier", ""
+            )
+            request_options["guardrailVersion"] = guardrails.get("guardrailVersion", "")
+            if self._guardrails_trace_enabled:
+                request_options["trace"] = "ENABLED"
+        self._request_options = request_options
+
     @property
     def _identifying_params(self) -> Dict[str, Any]:
         _model_kwargs = self.model_kwargs or {}
@@ -1008,13 +1240,14 @@ class BedrockBase(BaseLanguageModel, ABC):
             "base_model_id": self.base_model_id,
             "provider": self._get_provider(),
             "stream": self.streaming,
-            "trace": self.guardrails.get("trace"),  # type: ignore[union-attr]
-            "guardrailIdentifier": self.guardrails.get("guardrailIdentifier", None),  # type: ignore[union-attr]
-            "guardrailVersion": self.guardrails.get("guardrailVersion", None),  # type: ignore[union-attr]
+            **self._identifying_guardrails,
             **_model_kwargs,
         }
 
     def _get_provider(self) -> str:
+        if self._cached_provider is not None:
+            return self._cached_provider
+
         # If provider supplied by user, return as-is
         if self.provider:
             return self.provider
@@ -1032,6 +1265,8 @@ class BedrockBase(BaseLanguageModel, ABC):
         return parse_model_provider(self.model_id)
 
     def _get_base_model(self) -> str:
+        if self._cached_base_model is not None:
+            return self._cached_base_model
         return (
             self.base_model_id
             if self.base_model_id
@@ -1042,33 +1277,52 @@ class BedrockBase(BaseLanguageModel, ABC):
     def _model_is_anthropic(self) -> bool:
         return self._get_provider() == "anthropic"
 
-    @property
-    def _guardrails_enabled(self) -> bool:
+    def _check_guardrails_enabled(self) -> bool:
         """
         Determines if guardrails are enabled and correctly configured.
-        Checks if `guardrails` is a dictionary with non-empty `'id'` and
-        `'version'` keys.
-
-        Checks if `'guardrails.trace'` is true.
+        Checks if `guardrails` is a dictionary with non-empty
+        `'guardrailIdentifier'` and `'guardrailVersion'` keys. A mapping with
+        neither, such as the default, leaves guardrails disabled.
 
         Returns:
             bool: True if guardrails are correctly configured, False otherwise.
         Raises:
-            TypeError: If 'guardrails' lacks 'id' or 'version' keys.
+            ValueError: If only one of 'guardrailIdentifier' and
+                'guardrailVersion' is set.
 
         """
-        try:
-            return (
-                isinstance(self.guardrails, dict)
-                and bool(self.guardrails["guardrailIdentifier"])
-                and bool(self.guardrails["guardrailVersion"])
+        if not isinstance(self.guardrails, dict):
+            return False
+
+        identifier = self.guardrails.get("guardrailIdentifier")
+        version = self.guardrails.get("guardrailVersion")
+        if bool(identifier) != bool(version):
+            raise ValueError(
+                "Guardrails must be a dictionary with both 'guardrailIdentifier' "
+                "and 'guardrailVersion' keys."
             )
+        return bool(identifier)
 
-        except KeyError as e:
-            raise TypeError(
-                "Guardrails must be a dictionary with 'guardrailIdentifier'  \
-                and 'guardrailVersion' keys."
-            ) from e
+    def _build_input_body(
+        self,
+        provider: str,
+        params: Dict[str, Any],
+        prompt: Optional[str] = None,
+        system: Optional[Union[str, List[Dict[str, Any]]]] = None,
+        messages: Optional[List[Dict]] = None,
+        has_tools: bool = False,
+    ) -> Dict[str, Any]:
+        """Build the InvokeModel request body, passing tools through for Claude."""
+        return LLMInputOutputAdapter.prepare_input(
+            provider=provider,
+            model_kwargs=params,
+            prompt=prompt,
+            system=system,
+            messages=messages,
+            tools=params["tools"] if has_tools else None,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+        )
 
     def _prepare_input_and_invoke(
         self,
@@ -1087,85 +1341,48 @@ class BedrockBase(BaseLanguageModel, ABC):
         _model_kwargs = self.model_kwargs or {}
 
         provider = self._get_provider()
+        # Let providers that accept stop sequences end generation server side,
+        # the text is still truncated below for every provider
+        if stop and provider in _NATIVE_STOP_PROVIDERS:
+            stop_key = self.provider_stop_sequence_key_name_map[provider]
+            _model_kwargs = {**_model_kwargs, stop_key: stop}
         params = {**_model_kwargs, **kwargs}
+        has_tools = self._is_claude and _tools_in_params(params)
 
         # Pre-process for thinking with tool use
-        if (
-            messages
-            and "claude-" in self._get_base_model()
-            and thinking_in_params(params)
-        ):
+        if messages and self._is_claude and thinking_in_params(params):
             # We need to ensure thinking blocks are first in assistant messages
             # Process each message in the sequence
             for i, message in enumerate(messages):
                 if message.get("role") == "assistant" and i > 0:
                     content = message.get("content", [])
                     if isinstance(content, list) and content:
-                        # Find any thinking blocks
-                        thinking_blocks = [
-                            j
-                            for j, item in enumerate(content)
-                            if isinstance(item, dict)
-                            and item.get("type") in ["thinking", "redacted_thinking"]
-                        ]
+                        # Split thinking blocks from the rest in one pass
+                        thinking_content = []
+                        other_content = []
+                        for item in content:
+                            if (
+                                isinstance(item, dict)
+                                and item.get("type") in _THINKING_TYPES
+                            ):
+                                thinking_content.append(item)
+                            else:
+                                other_content.append(item)
 
                         # If thinking blocks exist but aren't first, reorder
-                        if thinking_blocks and thinking_blocks[0] > 0:
-                            # Extract thinking blocks
-                            thinking_content = [content[j] for j in thinking_blocks]
-                            # Extract non-thinking blocks
-                            other_content = [
-                                item
-                                for j, item in enumerate(content)
-                                if j not in thinking_blocks
-                            ]
-                            # Reorder with thinking first
+                        if thinking_content and content[0] is not thinking_content[0]:
                             message["content"] = thinking_content + other_content
 
-        if "claude-" in self._get_base_model() and _tools_in_params(params):
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
-                model_kwargs=params,
-                prompt=prompt,
-                system=system,
-                messages=messages,
-                tools=params["tools"],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-        else:
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
-                model_kwargs=params,
-                prompt=prompt,
-                system=system,
-                messages=messages,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-        body = json.dumps(input_body)
-        accept = "application/json"
-        contentType = "application/json"
-
-        request_options: dict[str, Any] = {
-            "body": body,
-            "modelId": self.model_id,
-            "accept": accept,
-            "contentType": contentType,
-        }
-
-        if self.service_tier:
-            request_options["serviceTier"] = self.service_tier
-
-        if self._guardrails_enabled:
-            request_options["guardrailIdentifier"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailIdentifier", ""
-            )
-            request_options["guardrailVersion"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailVersion", ""
-            )
-            if self.guardrails.get("trace"):  # type: ignore[union-attr]
-                request_options["trace"] = "ENABLED"
+        input_body = self._build_input_body(
+            provider,
+            params,
+            prompt=prompt,
+            system=system,
+            messages=messages,
+            has_tools=has_tools,
+        )
+        body = _json_dumps(input_body)
+        request_options = {**self._request_options, "body": body}
 
         try:
             logger.debug(f"Request body sent to bedrock: {request_options}")
@@ -1198,9 +1415,11 @@ class BedrockBase(BaseLanguageModel, ABC):
         # Verify and raise a callback error if any intervention occurs or a signal is
         # sent from a Bedrock service,
         # such as when guardrails are triggered.
-        services_trace = self._get_bedrock_services_signal(body)  # type: ignore[arg-type]
-
-        if run_manager is not None and services_trace.get("signal"):
+        if (
+            run_manager is not None
+            and self._guardrails_trace_enabled
+            and (services_trace := self._get_bedrock_services_signal(body))
+        ):
             run_manager.on_llm_error(
                 Exception(
                     f"Error raised by bedrock service: {services_trace.get('reason')}"
@@ -1210,30 +1429,24 @@ class BedrockBase(BaseLanguageModel, ABC):
 
         return text, tool_calls, llm_output, body
 
-    def _get_bedrock_services_signal(self, body: dict) -> dict:
+    def _get_bedrock_services_signal(self, body: dict) -> Optional[dict]:
         """This function checks the response body for an interrupt flag or message that
         indicates whether any of the Bedrock services have intervened in the processing
         flow. It is primarily used to identify modifications or interruptions imposed by
         these services during the request-response cycle with a Large Language Model.
 
+        Returns None when no service intervened.
+
         """  # noqa: E501
 
-        if (
-            self._guardrails_enabled
-            and self.guardrails.get("trace")  # type: ignore[union-attr]
-            and self._is_guardrails_intervention(body)
-        ):
+        if self._guardrails_trace_enabled and self._is_guardrails_intervention(body):
             return {
                 "signal": True,
                 "reason": "GUARDRAIL_INTERVENED",
                 "trace": body.get(AMAZON_BEDROCK_TRACE_KEY),
             }
 
-        return {
-            "signal": False,
-            "reason": None,
-            "trace": None,
-        }
+        return None
 
     def _is_guardrails_intervention(self, body: dict) -> bool:
         return body.get(GUARDRAILS_BODY_KEY) == "INTERVENED"
@@ -1265,30 +1478,20 @@ class BedrockBase(BaseLanguageModel, ABC):
             _model_kwargs["stream"] = True
 
         params = {**_model_kwargs, **kwargs}
+        has_tools = self._is_claude and _tools_in_params(params)
 
-        input_body = LLMInputOutputAdapter.prepare_input(
-            provider=provider,
+        input_body = self._build_input_body(
+            provider,
+            params,
             prompt=prompt,
             system=system,
             messages=messages,
-            model_kwargs=params,
-            max_tokens=self.max_tokens,
-            temperature=self.temperature,
+            has_tools=has_tools,
         )
         coerce_content_to_string = True
-        if "claude-" in self._get_base_model():
-            if _tools_in_params(params):
+        if self._is_claude:
+            if has_tools:
                 coerce_content_to_string = False
-                input_body = LLMInputOutputAdapter.prepare_input(
-                    provider=provider,
-                    model_kwargs=params,
-                    prompt=prompt,
-                    system=system,
-                    messages=messages,
-                    tools=params["tools"],
-                    max_tokens=self.max_tokens,
-                    temperature=self.temperature,
-                )
             elif thinking_in_params(params):
                 coerce_content_to_string = False
             elif thinking_on_by_default(
@@ -1298,27 +1501,8 @@ class BedrockBase(BaseLanguageModel, ABC):
             elif messages is not None and _citations_enabled(messages):
                 coerce_content_to_string = False
 
-        body = json.dumps(input_body)
-
-        request_options: dict[str, Any] = {
-            "body": body,
-            "modelId": self.model_id,
-            "accept": "application/json",
-            "contentType": "application/json",
-        }
-
-        if self.service_tier:
-            request_options["serviceTier"] = self.service_tier
-
-        if self._guardrails_enabled:
-            request_options["guardrailIdentifier"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailIdentifier", ""
-            )
-            request_options["guardrailVersion"] = self.guardrails.get(  # type: ignore[union-attr]
-                "guardrailVersion", ""
-            )
-            if self.guardrails.get("trace"):  # type: ignore[union-attr]
-                request_options["trace"] = "ENABLED"
+        body = _json_dumps(input_body)
+        request_options = {**self._request_options, "body": body}
 
         try:
             response = self.client.invoke_model_with_response_stream(**request_options)
@@ -1330,17 +1514,13 @@ class BedrockBase(BaseLanguageModel, ABC):
             raise e
 
         try:
-            for chunk in LLMInputOutputAdapter.prepare_output_stream(
+            yield from LLMInputOutputAdapter.prepare_output_stream(
                 provider,
                 response,
                 stop,
                 True if (messages and provider == "anthropic") else False,
                 coerce_content_to_string=coerce_content_to_string,
-            ):
-                yield chunk
-                # verify and raise callback error if any middleware intervened
-                if not isinstance(chunk, AIMessageChunk):
-                    self._get_bedrock_services_signal(chunk.generation_info)  # type: ignore[arg-type]
+            )
         finally:
             stream = response.get("body")
             if stream and hasattr(stream, "close"):
@@ -1370,36 +1550,24 @@ class BedrockBase(BaseLanguageModel, ABC):
             _model_kwargs["stream"] = True
 
         params = {**_model_kwargs, **kwargs}
-        if "claude-" in self._get_base_model() and _tools_in_params(params):
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
-                model_kwargs=params,
-                prompt=prompt,
-                system=system,
-                messages=messages,
-                tools=params["tools"],
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-        else:
-            input_body = LLMInputOutputAdapter.prepare_input(
-                provider=provider,
-                prompt=prompt,
-                system=system,
-                messages=messages,
-                model_kwargs=params,
-                max_tokens=self.max_tokens,
-                temperature=self.temperature,
-            )
-        body = json.dumps(input_body)
+        input_body = self._build_input_body(
+            provider,
+            params,
+            prompt=prompt,
+            system=system,
+            messages=messages,
+            has_tools=self._is_claude and _tools_in_params(params),
+        )
+        body = _json_dumps(input_body)
 
+        # Same as asyncio.to_thread, but on the bounded Bedrock pool
         response = await asyncio.get_running_loop().run_in_executor(
-            None,
-            lambda: self.client.invoke_model_with_response_stream(
+            _get_executor(self.max_parallel_requests),
+            functools.partial(
+                contextvars.copy_context().run,
+                self.client.invoke_model_with_response_stream,
+                **self._request_options,
                 body=body,
-                modelId=self.model_id,
-                accept="application/json",
-                contentType="application/json",
             ),
         )
 
@@ -1521,9 +1689,31 @@ class BedrockLLM(LLM, BedrockBase):
             Iterator[GenerationChunk]: Responses from the model.
 
         """
-        return self._prepare_input_and_invoke_stream(  # type: ignore
+        # Interventions can only be reported with guardrail tracing on
+        check_signal = run_manager is not None and self._guardrails_trace_enabled
+        guardrails_trace_info = None
+        for chunk in self._prepare_input_and_invoke_stream(
             prompt=prompt, stop=stop, run_manager=run_manager, **kwargs
-        )
+        ):
+            if (
+                check_signal
+                and guardrails_trace_info is None
+                and (generation_info := getattr(chunk, "generation_info", None))
+            ):
+                guardrails_trace_info = self._get_bedrock_services_signal(
+                    generation_info
+                )
+            yield chunk  # type: ignore[misc]
+
+        # If guardrails intervened during streaming, notify the callback handler
+        if guardrails_trace_info and run_manager is not None:
+            run_manager.on_llm_error(
+                Exception(
+                    "Error raised by bedrock service: "
+                    f"{guardrails_trace_info.get('reason')}"
+                ),
+                **guardrails_trace_info,
+            )
 
     def _call(
         self,
@@ -1591,6 +1781,75 @@ class BedrockLLM(LLM, BedrockBase):
 
         return text
 
+    def _generate(
+        self,
+        prompts: List[str],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        """Call out to Bedrock for each prompt, running up to
+        `max_parallel_requests` requests concurrently.
+        """
+        if len(prompts) < 2:
+            return super()._generate(
+                prompts, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+        executor = _get_executor(self.max_parallel_requests)
+        futures = [
+            executor.submit(
+                contextvars.copy_context().run,
+                functools.partial(
+                    self._call, prompt, stop=stop, run_manager=run_manager, **kwargs
+                ),
+            )
+            for prompt in prompts
+        ]
+        try:
+            texts = [future.result() for future in futures]
+        except BaseException:
+            # Drop prompts not started yet and let running calls finish, so none
+            # of them reports to the run manager after the error is raised
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            raise
+        return LLMResult(generations=[[Generation(text=text)] for text in texts])
+
+    async def _agenerate(
+        self,
+        prompts: List[str],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        """Call out to Bedrock for each prompt, keeping up to
+        `max_parallel_requests` responses streaming at once.
+        """
+        if len(prompts) < 2:
+            return await super()._agenerate(
+                prompts, stop=stop, run_manager=run_manager, **kwargs
+            )
+
+        semaphore = asyncio.Semaphore(self.max_parallel_requests)
+
+        async def _bounded_acall(prompt: str) -> str:
+            async with semaphore:
+                return await self._acall(
+                    prompt, stop=stop, run_manager=run_manager, **kwargs
+                )
+
+        tasks = [asyncio.ensure_future(_bounded_acall(prompt)) for prompt in prompts]
+        try:
+            texts = await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+        return LLMResult(generations=[[Generation(text=text)] for text in texts])
+
     async def _astream(
         self,
         prompt: str,
@@ -1613,11 +1872,30 @@ class BedrockLLM(LLM, BedrockBase):
             the streamed responses.
 
         """
+        check_signal = run_manager is not None and self._guardrails_trace_enabled
+        guardrails_trace_info = None
         async for chunk in self._aprepare_input_and_invoke_stream(
             prompt=prompt, stop=stop, run_manager=run_manager, **kwargs
         ):
+            if (
+                check_signal
+                and guardrails_trace_info is None
+                and (generation_info := getattr(chunk, "generation_info", None))
+            ):
+                guardrails_trace_info = self._get_bedrock_services_signal(
+                    generation_info
+                )
             yield chunk  # type: ignore
 
+        if guardrails_trace_info and run_manager is not None:
+            await run_manager.on_llm_error(
+                Exception(
+                    "Error raised by bedrock service: "
+                    f"{guardrails_trace_info.get('reason')}"
+                ),
+                **guardrails_trace_info,
+            )
+
     async def _acall(
         self,
         prompt: str,
@@ -1644,6 +1922,14 @@ class BedrockLLM(LLM, BedrockBase):
         if not self.streaming:
             raise ValueError("Streaming must be set to True for async operations. ")
 
+        if run_manager is None:
+            # Without a callback to report to, only the text needs to be kept
+            text_parts = [
+                chunk.text
+                async for chunk in self._astream(prompt=prompt, stop=stop, **kwargs)
+            ]
+            return "".join(text_parts)
+
         provider = self._get_provider()
         provider_stop_reason_code = self.provider_stop_reason_key_map.get(
             provider, "stop_reason"
@@ -1656,22 +1942,21 @@ class BedrockLLM(LLM, BedrockBase):
             )
         ]
 
-        if run_manager is not None:
-            chunks_generation_info = [
-                chunk.generation_info
-                for chunk in chunks
-                if chunk.generation_info is not None
-            ]
-            llm_output = _combine_generation_info_for_llm_result(
-                chunks_generation_info, provider_stop_code=provider_stop_reason_code
-            )
-            generations = [
-                Generation(text=chunk.text, generation_info=chunk.generation_info)
-                for chunk in chunks
-            ]
-            await run_manager.on_llm_end(
-                LLMResult(generations=[generations], llm_output=llm_output)
-            )
+        chunks_generation_info = [
+            chunk.generation_info
+            for chunk in chunks
+            if chunk.generation_info is not None
+        ]
+        llm_output = _combine_generation_info_for_llm_result(
+            chunks_generation_info, provider_stop_code=provider_stop_reason_code
+        )
+        generations = [
+            Generation(text=chunk.text, generation_info=chunk.generation_info)
+            for chunk in chunks
+        ]
+        await run_manager.on_llm_end(
+            LLMResult(generations=[generations], llm_output=llm_output)
+        )
 
         return "".join([chunk.text for chunk in chunks])
 
@@ -1685,7 +1970,8 @@ class BedrockLLM(LLM, BedrockBase):
         if self._model_is_anthropic and not self.custom_get_token_ids:
             if anthropic_tokens_supported():
                 return get_token_ids_anthropic(text)
-            else:
+            elif not self._anthropic_tokens_warned:
+                self._anthropic_tokens_warned = True
                 warnings.warn(
                     "Falling back to default token method due to missing or "
                     "incompatible `anthropic` installation "
@@ -1,3 +1,4 @@
+import functools
 import logging
 import os
 import re
@@ -93,8 +94,12 @@ def enforce_stop_tokens(text: str, stop: List[str]) -> str:
     return re.split("|".join(stop), text, maxsplit=1)[0]
 
 
+@functools.lru_cache(maxsize=None)
 def anthropic_tokens_supported() -> bool:
-    """Check if all requirements for Anthropic count_tokens() are met."""
+    """Check if all requirements for Anthropic count_tokens() are met.
+
+    The result depends only on installed packages, so it is computed once.
+    """
     try:
         import anthropic
     except ImportError:
@@ -471,10 +476,10 @@ def create_aws_bedrock_runtime_client(
 
 def parse_model_provider(model_id: str) -> str:
     """Extract the provider from a Bedrock model ID."""
-    parts = model_id.split(".", maxsplit=2)
-    if len(parts) > 1 and parts[0].lower() in MODEL_ID_GEO_PREFIXES:
-        return parts[1]
-    return parts[0]
+    prefix, dot, rest = model_id.partition(".")
+    if dot and prefix.lower() in MODEL_ID_GEO_PREFIXES:
+        return rest.partition(".")[0]
+    return prefix
 
 
 def thinking_in_params(params: dict) -> bool:
@@ -14,7 +14,7 @@ from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_core.messages import AIMessage, HumanMessage, SystemMessage, ToolMessage
 from langchain_core.runnables import RunnableBinding
 from langchain_core.tools import BaseTool
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from langchain_aws import ChatBedrock
 from langchain_aws.chat_models.bedrock import (
@@ -2221,6 +2221,66 @@ def test_stream_thinking_on_by_default_returns_block_content(model_id: str) -> N
     assert len(text_blocks) == 1
 
 
+@pytest.mark.parametrize("guardrails", [{}, {"trace": True}])
+def test_partial_guardrails_construct(guardrails: Dict[str, Any]) -> None:
+    """Test that an incomplete guardrails mapping disables guardrails."""
+    llm = ChatBedrock(
+        client=MagicMock(),
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        guardrails=guardrails,
+    )
+    assert not llm._guardrails_enabled
+
+
+def test_incomplete_guardrails_raise() -> None:
+    """Test that an identifier without a version fails construction."""
+    with pytest.raises(ValidationError, match="guardrailVersion"):
+        ChatBedrock(
+            client=MagicMock(),
+            model_id="mistral.mistral-7b-instruct-v0:2",
+            region_name="us-west-2",
+            guardrails={"guardrailIdentifier": "gid"},
+        )
+
+
+def test_stream_reports_guardrail_intervention_once() -> None:
+    """Test that a guardrail intervention is reported once per stream."""
+    mock_client = MagicMock()
+    mock_client.invoke_model_with_response_stream.return_value = {
+        "body": [
+            {
+                "chunk": {
+                    "bytes": json.dumps(
+                        {
+                            "outputs": [{"text": "Sorry.", "stop_reason": "stop"}],
+                            "amazon-bedrock-guardrailAction": "INTERVENED",
+                        }
+                    ).encode()
+                }
+            },
+        ]
+    }
+    run_manager = MagicMock()
+
+    llm = ChatBedrock(
+        client=mock_client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        guardrails={
+            "guardrailIdentifier": "gid",
+            "guardrailVersion": "1",
+            "trace": True,
+        },
+    )
+    list(llm._stream([HumanMessage(content="Hi")], run_manager=run_manager))
+
+    run_manager.on_llm_error.assert_called_once()
+    assert run_manager.on_llm_error.call_args.kwargs["reason"] == (
+        "GUARDRAIL_INTERVENED"
+    )
+
+
 def test_stream_system_prompt_cache_control() -> None:
     """Test that cache_control is preserved in streaming."""
     mock_client = MagicMock()
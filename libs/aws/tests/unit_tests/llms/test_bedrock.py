@@ -1,17 +1,27 @@
 # type:ignore
 
+import contextvars
 import json
+import threading
+import time
 from typing import AsyncGenerator, Dict
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_core.caches import InMemoryCache
 from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import GenerationChunk
+from pydantic import ValidationError
 
 from langchain_aws import BedrockLLM
 from langchain_aws.llms.bedrock import (
+    _CLIENTS,
     ALTERNATION_ERROR,
     LLMInputOutputAdapter,
+    _combine_generation_info_for_llm_result,
+    _get_executor,
     _human_assistant_format,
+    _stream_response_to_generation_chunk,
 )
 
 TEST_CASES = {
@@ -264,6 +274,18 @@ def test__human_assistant_format() -> None:
             assert output == expected_output
 
 
+def test__human_assistant_format_warns_once_with_truncated_prompt() -> None:
+    input_text = "\n\nHuman: Hi" * 3 + "\n\nAssistant: " + "x" * 1000
+
+    with pytest.warns(UserWarning, match=ALTERNATION_ERROR) as record:
+        _human_assistant_format(input_text)
+
+    assert len(record) == 1
+    message = str(record[0].message)
+    assert "(2 out-of-order turn(s))" in message
+    assert len(message) < len(input_text)
+
+
 # Sample mock streaming response data
 MOCK_STREAMING_RESPONSE = [
     {"chunk": {"bytes": b'{"text": "nice"}'}},
@@ -409,6 +431,21 @@ async def test_bedrock_async_streaming_call() -> None:
     assert chunks[2] == " you"
 
 
+async def test_bedrock_acall_joins_streamed_text() -> None:
+    async def astream(*args, **kwargs):
+        for text in ["nice", " to meet", " you"]:
+            yield GenerationChunk(text=text)
+
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="anthropic.claude-v2",
+        streaming=True,
+        region_name="us-west-2",
+    )
+    with patch.object(BedrockLLM, "_astream", side_effect=astream):
+        assert await llm._acall("Hey, how are you?") == "nice to meet you"
+
+
 @pytest.fixture
 def mistral_response():
     body = MagicMock()
@@ -627,6 +664,17 @@ def test_prepare_output_stream_for_mistral(mistral_streaming_response) -> None:
     assert results[1] == "you."
 
 
+async def test_aprepare_output_stream_for_mistral(mistral_streaming_response) -> None:
+    results = [
+        chunk.text
+        async for chunk in LLMInputOutputAdapter.aprepare_output_stream(
+            "mistral", mistral_streaming_response
+        )
+    ]
+
+    assert results == ["Thank", "you.", ""]
+
+
 def test_prepare_output_for_deepseek(deepseek_response):
     result = LLMInputOutputAdapter.prepare_output("deepseek", deepseek_response)
     assert result["text"] == "This is the DeepSeek output text."
@@ -749,6 +797,205 @@ def test_prepare_output_for_ai21(ai21_response):
     assert result["stop_reason"] is None
 
 
+def test_combine_generation_info_for_llm_result():
+    chunks_generation_info = [
+        {"usage": {"input_tokens": [10], "output_tokens": 2}},
+        {"usage": {"output_tokens": [3, 4]}},
+        {
+            "amazon-bedrock-invocationMetrics": {
+                "inputTokenCount": 5,
+                "outputTokenCount": 1,
+            },
+            "stop_reason": "end_turn",
+        },
+    ]
+
+    result = _combine_generation_info_for_llm_result(
+        chunks_generation_info, provider_stop_code="stop_reason"
+    )
+
+    assert result == {
+        "usage": {"prompt_tokens": 15, "completion_tokens": 10, "total_tokens": 25},
+        "stop_reason": "end_turn",
+    }
+
+
+def test_stream_response_to_generation_chunk_does_not_mutate_delta():
+    stream_response = {
+        "type": "content_block_delta",
+        "index": 1,
+        "delta": {"type": "input_json_delta", "partial_json": '{"city": '},
+    }
+
+    chunk = _stream_response_to_generation_chunk(
+        stream_response,
+        provider="anthropic",
+        output_key="message",
+        messages_api=True,
+        coerce_content_to_string=False,
+    )
+
+    assert chunk.content == [
+        {"type": "tool_use", "partial_json": '{"city": ', "index": 1}
+    ]
+    assert chunk.tool_call_chunks[0]["args"] == '{"city": '
+    assert stream_response["delta"] == {
+        "type": "input_json_delta",
+        "partial_json": '{"city": ',
+    }
+
+
+def test_prepare_input_moves_thinking_first_for_tool_result():
+    thinking = {"type": "thinking", "thinking": "Let me think", "signature": "sig"}
+    tool_use = {"type": "tool_use", "id": "t1", "name": "get_weather", "input": {}}
+    messages = [
+        {"role": "user", "content": "What's the weather?"},
+        {"role": "assistant", "content": [tool_use, thinking]},
+        {
+            "role": "user",
+            "content": [{"type": "tool_result", "tool_use_id": "t1", "content": "Sun"}],
+        },
+    ]
+
+    input_body = LLMInputOutputAdapter.prepare_input(
+        provider="anthropic",
+        model_kwargs={"thinking": {"type": "enabled", "budget_tokens": 1024}},
+        messages=messages,
+    )
+
+    assert input_body["messages"][1]["content"] == [thinking, tool_use]
+
+
+def test_prepare_input_and_invoke_moves_thinking_first(anthropic_response):
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = anthropic_response
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="anthropic.claude-sonnet-4-20250514-v1:0",
+        region_name="us-west-2",
+    )
+    thinking = {"type": "thinking", "thinking": "Hmm", "signature": "sig"}
+    text = {"type": "text", "text": "Let me check."}
+    messages = [
+        {"role": "user", "content": "Hi"},
+        {"role": "assistant", "content": [text, thinking]},
+        {"role": "user", "content": "Go on"},
+    ]
+
+    llm._prepare_input_and_invoke(
+        messages=messages, thinking={"type": "enabled", "budget_tokens": 1024}
+    )
+
+    body = json.loads(mock_client.invoke_model.call_args.kwargs["body"])
+    assert body["messages"][1]["content"] == [thinking, text]
+
+
+def test_prepare_input_and_invoke_sends_stop_sequences(anthropic_response):
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = anthropic_response
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="anthropic.claude-sonnet-4-20250514-v1:0",
+        region_name="us-west-2",
+    )
+
+    text, *_ = llm._prepare_input_and_invoke(prompt="Hi", stop=["output"])
+
+    body = json.loads(mock_client.invoke_model.call_args.kwargs["body"])
+    assert body["stop_sequences"] == ["output"]
+    assert text == "This is the "
+    assert llm.model_kwargs is None
+
+
+@pytest.mark.parametrize(
+    "model_id",
+    [
+        "mistral.mistral-7b-instruct-v0:2",
+        "amazon.titan-text-express-v1",
+        "ai21.j2-ultra-v1",
+    ],
+)
+def test_prepare_input_and_invoke_truncates_stop_client_side(model_id):
+    body = MagicMock()
+    body.read.return_value = json.dumps(
+        {
+            "outputs": [{"text": "foo STOP bar"}],
+            "results": [{"outputText": "foo STOP bar"}],
+            "completions": [{"data": {"text": "foo STOP bar"}}],
+        }
+    ).encode()
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = {"body": body}
+    llm = BedrockLLM(client=mock_client, model_id=model_id, region_name="us-west-2")
+
+    text, *_ = llm._prepare_input_and_invoke(prompt="Hi", stop=["STOP"])
+
+    request = json.loads(mock_client.invoke_model.call_args.kwargs["body"])
+    assert "stop_sequences" not in request
+    assert "stopSequences" not in request.get("textGenerationConfig", {})
+    assert text == "foo "
+
+
+def test_prepare_input_and_invoke_truncates_without_stop_key(deepseek_response):
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = deepseek_response
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="deepseek.r1-v1:0",
+        region_name="us-west-2",
+    )
+
+    text, *_ = llm._prepare_input_and_invoke(prompt="Hi", stop=["output"])
+
+    body = json.loads(mock_client.invoke_model.call_args.kwargs["body"])
+    assert "stop_sequences" not in body
+    assert text == "This is the DeepSeek "
+
+
+def test_get_token_ids_warns_once_without_anthropic_tokenizer():
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="anthropic.claude-sonnet-4-20250514-v1:0",
+        region_name="us-west-2",
+    )
+
+    with (
+        patch(
+            "langchain_aws.llms.bedrock.anthropic_tokens_supported",
+            return_value=False,
+        ),
+        patch(
+            "langchain_core.language_models.llms.BaseLLM.get_token_ids",
+            return_value=[1, 2],
+        ),
+        pytest.warns(UserWarning, match="Falling back") as record,
+    ):
+        assert llm.get_token_ids("Hi") == [1, 2]
+        assert llm.get_token_ids("Hi") == [1, 2]
+
+    assert len(record) == 1
+
+
+def test_identifying_params_include_guardrails():
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        guardrails={"guardrailIdentifier": "gid", "guardrailVersion": "1"},
+        model_kwargs={"top_p": 0.5},
+    )
+    assert llm._identifying_params == {
+        "model_id": "meta.llama3-8b-instruct-v1:0",
+        "base_model_id": None,
+        "provider": "meta",
+        "stream": False,
+        "trace": None,
+        "guardrailIdentifier": "gid",
+        "guardrailVersion": "1",
+        "top_p": 0.5,
+    }
+
+
 def test_standard_tracing_params():
     llm = BedrockLLM(model_id="foo", region_name="us-west-2")
     ls_params = llm._get_ls_params()
@@ -944,6 +1191,257 @@ def test__get_base_model():
     assert llm._get_base_model() == "meta.llama3-8b-instruct-v1:0"
 
 
+def test_provider_and_base_model_resolved_at_init():
+    llm = BedrockLLM(model_id="us.anthropic.claude-v2:1", region_name="us-west-2")
+    assert llm._cached_provider == "anthropic"
+    assert llm._cached_base_model == "anthropic.claude-v2:1"
+    assert llm._is_claude
+
+    with patch("langchain_aws.llms.bedrock.parse_model_provider") as mock_parse:
+        assert llm._get_provider() == "anthropic"
+    mock_parse.assert_not_called()
+
+
+def test_resolved_settings_are_private_per_instance_state():
+    first = BedrockLLM(
+        client=MagicMock(),
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+    second = BedrockLLM(
+        client=MagicMock(),
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        service_tier="flex",
+    )
+
+    for name in ("_cached_provider", "_is_claude", "_request_options"):
+        assert name in BedrockLLM.__private_attributes__
+        assert name not in BedrockLLM.model_fields
+    assert "_request_options" not in first.model_dump()
+    assert first._request_options is not second._request_options
+    assert "serviceTier" not in first._request_options
+
+
+def test_reassigned_fields_update_resolved_settings(mistral_response):
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = mistral_response
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+
+    llm.model_id = "mistral.mistral-7b-instruct-v0:2"
+    llm.service_tier = "flex"
+    llm.guardrails = {"guardrailIdentifier": "gid", "guardrailVersion": "1"}
+    llm._prepare_input_and_invoke(prompt="Hi")
+
+    assert llm._get_provider() == "mistral"
+    assert llm._identifying_params["guardrailIdentifier"] == "gid"
+    kwargs = mock_client.invoke_model.call_args.kwargs
+    assert kwargs["modelId"] == "mistral.mistral-7b-instruct-v0:2"
+    assert kwargs["serviceTier"] == "flex"
+    assert kwargs["guardrailIdentifier"] == "gid"
+
+    llm.model_id = "anthropic.claude-sonnet-4-20250514-v1:0"
+    assert llm._is_claude
+
+
+def test_provider_required_for_arn_model_id():
+    llm = BedrockLLM(
+        model_id="arn:aws:bedrock:us-east-1::custom-model/my-model",
+        region_name="us-west-2",
+    )
+    with pytest.raises(ValueError, match="Model provider should be supplied"):
+        llm._get_provider()
+
+
+def test_guardrail_request_options_sent_with_invoke(anthropic_response):
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = anthropic_response
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="anthropic.claude-sonnet-4-20250514-v1:0",
+        region_name="us-west-2",
+        guardrails={
+            "guardrailIdentifier": "gid",
+            "guardrailVersion": "1",
+            "trace": True,
+        },
+    )
+    assert llm._guardrails_enabled
+
+    llm._prepare_input_and_invoke(prompt="Hi")
+
+    kwargs = mock_client.invoke_model.call_args.kwargs
+    assert kwargs["guardrailIdentifier"] == "gid"
+    assert kwargs["guardrailVersion"] == "1"
+    assert kwargs["trace"] == "ENABLED"
+
+
+def test_prepare_input_and_invoke_reports_guardrail_intervention():
+    body = MagicMock()
+    body.read.return_value = json.dumps(
+        {
+            "outputs": [{"text": "Sorry.", "stop_reason": "stop"}],
+            "amazon-bedrock-guardrailAction": "INTERVENED",
+        }
+    ).encode()
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = {"body": body}
+    run_manager = MagicMock()
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        guardrails={
+            "guardrailIdentifier": "gid",
+            "guardrailVersion": "1",
+            "trace": True,
+        },
+    )
+
+    llm._prepare_input_and_invoke(prompt="Hi", run_manager=run_manager)
+
+    run_manager.on_llm_error.assert_called_once()
+    assert run_manager.on_llm_error.call_args.kwargs["signal"] is True
+    assert llm._get_bedrock_services_signal({"outputs": []}) is None
+
+
+@pytest.mark.parametrize("guardrails", [{}, {"trace": True}])
+def test_partial_guardrails_disable_guardrails(guardrails, mistral_response):
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = mistral_response
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        guardrails=guardrails,
+    )
+    assert not llm._guardrails_enabled
+
+    llm._prepare_input_and_invoke(prompt="Hi")
+
+    kwargs = mock_client.invoke_model.call_args.kwargs
+    assert "guardrailIdentifier" not in kwargs
+    assert "trace" not in kwargs
+
+
+@pytest.mark.parametrize(
+    "guardrails", [{"guardrailIdentifier": "gid"}, {"guardrailVersion": "1"}]
+)
+def test_incomplete_guardrails_raise(guardrails):
+    with pytest.raises(ValidationError, match="guardrailIdentifier"):
+        BedrockLLM(
+            client=MagicMock(),
+            model_id="mistral.mistral-7b-instruct-v0:2",
+            region_name="us-west-2",
+            guardrails=guardrails,
+        )
+
+
+def test_bedrock_llm_uses_langchain_cache(anthropic_response):
+    mock_client = MagicMock()
+    mock_client.invoke_model.return_value = anthropic_response
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="anthropic.claude-sonnet-4-20250514-v1:0",
+        region_name="us-west-2",
+        cache=InMemoryCache(),
+    )
+
+    first = llm.invoke("Hi")
+    second = llm.invoke("Hi")
+
+    assert first == second
+    assert mock_client.invoke_model.call_count == 1
+
+
+@patch.dict("langchain_aws.llms.bedrock._CLIENTS", clear=True)
+@patch("langchain_aws.llms.bedrock.create_aws_client")
+def test_bedrock_clients_shared_across_instances(mock_create_client):
+    mock_create_client.side_effect = lambda **kwargs: MagicMock()
+
+    first = BedrockLLM(
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        client_shared=True,
+    )
+    second = BedrockLLM(
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        client_shared=True,
+    )
+    other_region = BedrockLLM(
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-east-1",
+        client_shared=True,
+    )
+
+    assert first.client is second.client
+    assert first.bedrock_client is second.bedrock_client
+    assert first.client is not other_region.client
+    assert mock_create_client.call_count == 4
+
+
+@patch.dict("langchain_aws.llms.bedrock._CLIENTS", clear=True)
+@patch("langchain_aws.llms.bedrock.create_aws_client")
+def test_bedrock_clients_with_session_token_not_shared(mock_create_client):
+    mock_create_client.side_effect = lambda **kwargs: MagicMock()
+
+    llms = [
+        BedrockLLM(
+            model_id="meta.llama3-8b-instruct-v1:0",
+            region_name="us-west-2",
+            aws_access_key_id="AKID",
+            aws_secret_access_key="secret",
+            aws_session_token=f"token-{i}",
+            client_shared=True,
+        )
+        for i in range(2)
+    ]
+
+    assert llms[0].client is not llms[1].client
+    assert not _CLIENTS
+
+
+@patch.dict("langchain_aws.llms.bedrock._CLIENTS", clear=True)
+@patch("langchain_aws.llms.bedrock._MAX_SHARED_CLIENTS", 2)
+@patch("langchain_aws.llms.bedrock.create_aws_client")
+def test_shared_bedrock_clients_are_bounded(mock_create_client):
+    mock_create_client.side_effect = lambda **kwargs: MagicMock()
+
+    for region in ("us-west-2", "us-east-1", "eu-west-1"):
+        BedrockLLM(
+            model_id="meta.llama3-8b-instruct-v1:0",
+            region_name=region,
+            client_shared=True,
+        )
+
+    assert len(_CLIENTS) == 2
+
+
+def test_effective_config_grows_connection_pool():
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+        max_parallel_requests=32,
+        timeout=30,
+    )
+    config = llm._get_effective_config()
+    assert config.max_pool_connections == 32
+    assert config.connect_timeout == 30
+
+    llm = BedrockLLM(
+        client=MagicMock(),
+        model_id="meta.llama3-8b-instruct-v1:0",
+        region_name="us-west-2",
+    )
+    assert llm._get_effective_config() is None
+
+
 @patch("langchain_aws.llms.bedrock.create_aws_client")
 def test_bedrock_client_creation(mock_create_client):
     """Test that both bedrock-runtime and bedrock clients are created."""
@@ -1053,6 +1551,45 @@ def test_stream_closes_response_body_on_exception() -> None:
     mock_body.close.assert_called_once()
 
 
+def test_stream_reports_guardrail_intervention() -> None:
+    mock_client = MagicMock()
+    mock_client.invoke_model_with_response_stream.return_value = {
+        "body": [
+            {
+                "chunk": {
+                    "bytes": b'{"outputs": [{"text": "Sorry", "stop_reason": null}]'
+                    b', "amazon-bedrock-guardrailAction": "INTERVENED"}'
+                }
+            },
+            {
+                "chunk": {
+                    "bytes": b'{"outputs": [{"text": ".", "stop_reason": "stop"}]'
+                    b', "amazon-bedrock-guardrailAction": "INTERVENED"}'
+                }
+            },
+        ]
+    }
+    run_manager = MagicMock()
+
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        guardrails={
+            "guardrailIdentifier": "gid",
+            "guardrailVersion": "1",
+            "trace": True,
+        },
+    )
+    list(llm._stream(prompt="Hi", run_manager=run_manager))
+
+    # Reported once per stream, not once per intervened chunk
+    run_manager.on_llm_error.assert_called_once()
+    assert run_manager.on_llm_error.call_args.kwargs["reason"] == (
+        "GUARDRAIL_INTERVENED"
+    )
+
+
 @pytest.mark.asyncio
 async def test_astream_closes_response_body(
     anthropic_streaming_response_with_close,
@@ -1076,6 +1613,141 @@ async def test_astream_closes_response_body(
     anthropic_streaming_response_with_close["body"].close.assert_called_once()
 
 
+async def test_astream_invokes_model_on_bedrock_thread_pool(
+    anthropic_streaming_response_with_close,
+) -> None:
+    thread_names = []
+    request_id: contextvars.ContextVar[str] = contextvars.ContextVar("request_id")
+    request_id.set("abc")
+    seen_request_ids = []
+
+    def invoke_model_with_response_stream(**kwargs):
+        thread_names.append(threading.current_thread().name)
+        seen_request_ids.append(request_id.get(None))
+        return anthropic_streaming_response_with_close
+
+    mock_client = MagicMock()
+    mock_client.invoke_model_with_response_stream.side_effect = (
+        invoke_model_with_response_stream
+    )
+    llm = BedrockLLM(
+        client=mock_client,
+        model="us.anthropic.claude-sonnet-4-5-20250929-v1:0",
+        region="us-west-2",
+        max_parallel_requests=3,
+    )
+
+    async for _ in llm._aprepare_input_and_invoke_stream(prompt="Hello"):
+        pass
+
+    assert thread_names[0].startswith("langchain-aws-bedrock")
+    assert seen_request_ids == ["abc"]
+    assert _get_executor(3) is _get_executor(3)
+    assert _get_executor(3)._max_workers == 3
+
+
+@pytest.mark.asyncio
+async def test_astream_sends_service_tier_and_guardrails(
+    anthropic_streaming_response_with_close,
+) -> None:
+    mock_client = MagicMock()
+    mock_client.invoke_model_with_response_stream.return_value = (
+        anthropic_streaming_response_with_close
+    )
+    llm = BedrockLLM(
+        client=mock_client,
+        model="us.anthropic.claude-sonnet-4-5-20250929-v1:0",
+        region="us-west-2",
+        service_tier="flex",
+        guardrails={"guardrailIdentifier": "gid", "guardrailVersion": "1"},
+    )
+
+    async for _ in llm._aprepare_input_and_invoke_stream(prompt="Hello"):
+        pass
+
+    kwargs = mock_client.invoke_model_with_response_stream.call_args.kwargs
+    assert kwargs["modelId"] == "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
+    assert kwargs["serviceTier"] == "flex"
+    assert kwargs["guardrailIdentifier"] == "gid"
+    assert kwargs["guardrailVersion"] == "1"
+    assert "trace" not in kwargs
+
+
+def test_batch_invokes_model_concurrently() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def invoke_model(**kwargs):
+        # Both requests must be in flight at once for the barrier to release
+        barrier.wait()
+        body = MagicMock()
+        body.read.return_value = json.dumps(
+            {"outputs": [{"text": "Hello", "stop_reason": "stop"}]}
+        ).encode()
+        return {"body": body}
+
+    mock_client = MagicMock()
+    mock_client.invoke_model.side_effect = invoke_model
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+    )
+
+    assert llm.batch(["Hi", "Bye"]) == ["Hello", "Hello"]
+    assert mock_client.invoke_model.call_count == 2
+
+
+def test_batch_waits_for_running_calls_before_raising() -> None:
+    finished = []
+
+    def invoke_model(**kwargs):
+        if "Fail" in json.loads(kwargs["body"])["prompt"]:
+            raise RuntimeError("Test error")
+        time.sleep(0.2)
+        finished.append(True)
+        body = MagicMock()
+        body.read.return_value = json.dumps(
+            {"outputs": [{"text": "Hello", "stop_reason": "stop"}]}
+        ).encode()
+        return {"body": body}
+
+    mock_client = MagicMock()
+    mock_client.invoke_model.side_effect = invoke_model
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+    )
+
+    with pytest.raises(RuntimeError, match="Test error"):
+        llm.generate(["Fail", "Hi"])
+
+    # The other call completed before the error left generate()
+    assert finished == [True]
+
+
+@pytest.mark.asyncio
+async def test_abatch_streams_concurrently() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+
+    def invoke_model_with_response_stream(**kwargs):
+        barrier.wait()
+        return {"body": list(MOCK_STREAMING_RESPONSE_MISTRAL)}
+
+    mock_client = MagicMock()
+    mock_client.invoke_model_with_response_stream.side_effect = (
+        invoke_model_with_response_stream
+    )
+    llm = BedrockLLM(
+        client=mock_client,
+        model_id="mistral.mistral-7b-instruct-v0:2",
+        region_name="us-west-2",
+        streaming=True,
+    )
+
+    assert await llm.abatch(["Hi", "Bye"]) == ["Thankyou.", "Thankyou."]
+
+
 @pytest.mark.asyncio
 async def test_astream_closes_response_body_on_exception() -> None:
     mock_client = MagicMock()